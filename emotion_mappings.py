@@ -20,33 +20,29 @@ EMOTIONS = [
     'joyful', 'trusting', 'fearful', 'surprised', 'sad', 'disgusted', 'angry', 'hopeful',
     
     # Additional Common Emotions
-    'anxiety', 'contentment', 'gratitude', 'guilt', 'jealousy', 'pride', 'shame', 'hope',
-    'frustration', 'loneliness', 'excitement', 'awe', 'envy', 'pity', 'despair', 'relief',
-    'embarrassment', 'disappointment', 'affection', 'compassion', 'satisfaction', 'wonder',
-    'confusion', 'regret', 'resentment', 'humiliation', 'happiness', 'misery', 'elation',
-    'devastation', 'fulfillment', 'insecurity', 'isolation', 'overwhelm', 'peace', 'vulnerability',
-    'bitterness', 'desperation', 'disillusionment', 'empowerment', 'freedom', 'gloom', 'helplessness',
-    'inspiration', 'longing', 'melancholy', 'nostalgia', 'panic', 'passion', 'pessimism', 'rage',
-    'remorse', 'skepticism', 'tenderness', 'uneasiness', 'worry', 'zeal', 'admiration', 'agitation',
-    'amazement', 'amusement', 'anger', 'anguish', 'annoyance', 'anticipation', 'anxiety', 'apathy',
-    'apprehension', 'arrogance', 'awe', 'boredom', 'confidence', 'confusion', 'contempt', 'contentment',
-    'courage', 'curiosity', 'defeat', 'defensiveness', 'delight', 'depression', 'desire', 'despair',
-    'disappointment', 'disapproval', 'disgust', 'dismay', 'displeasure', 'distress', 'doubt', 'dread',
-    'eagerness', 'ecstasy', 'elation', 'embarrassment', 'empathy', 'enchantment', 'enjoyment', 'envy',
-    'euphoria', 'excitement', 'fear', 'frustration', 'gratitude', 'grief', 'guilt', 'happiness',
-    'hate', 'helplessness', 'homesickness', 'hope', 'hopelessness', 'horror', 'hostility', 'humiliation',
-    'hurt', 'hysteria', 'indifference', 'insecurity', 'insult', 'interest', 'irritation', 'isolation',
-    'jealousy', 'joy', 'loneliness', 'longing', 'love', 'lust', 'misery', 'neglect', 'optimism',
-    'outrage', 'panic', 'passion', 'pessimism', 'pity', 'pleasure', 'pride', 'rage', 'regret',
-    'rejection', 'relaxation', 'relief', 'reluctance', 'remorse', 'resentment', 'sadness', 'satisfaction',
-    'scorn', 'self-pity', 'shame', 'shock', 'sorrow', 'suffering', 'surprise', 'suspicion', 'sympathy',
-    'tenderness', 'tension', 'terror', 'thankfulness', 'thrill', 'triumph', 'uncertainty', 'uneasiness',
-    'unhappiness', 'vulnerability', 'warmth', 'wonder', 'worry', 'wrath', 'zeal'
+    'anxiety', 'contentment', 'gratitude', 'guilt', 'jealousy', 'pride', 'shame', 'hope', 'frustration',
+    'loneliness', 'excitement', 'envy', 'pity', 'despair', 'relief', 'embarrassment', 'disappointment',
+    'affection', 'compassion', 'satisfaction', 'wonder', 'confusion', 'regret', 'resentment',
+    'humiliation', 'happiness', 'misery', 'elation', 'devastation', 'fulfillment', 'insecurity',
+    'isolation', 'overwhelm', 'peace', 'vulnerability', 'bitterness', 'desperation', 'disillusionment',
+    'empowerment', 'freedom', 'gloom', 'helplessness', 'inspiration', 'longing', 'melancholy',
+    'nostalgia', 'panic', 'passion', 'pessimism', 'skepticism', 'tenderness', 'uneasiness', 'worry',
+    'zeal', 'agitation', 'amusement', 'anguish', 'apathy', 'arrogance', 'confidence', 'courage',
+    'curiosity', 'defeat', 'defensiveness', 'delight', 'depression', 'desire', 'dismay', 'displeasure',
+    'distress', 'doubt', 'dread', 'eagerness', 'empathy', 'enchantment', 'enjoyment', 'euphoria',
+    'hate', 'homesickness', 'hopelessness', 'horror', 'hostility', 'hurt', 'hysteria', 'indifference',
+    'insult', 'irritation', 'lust', 'neglect', 'outrage', 'pleasure', 'rejection', 'relaxation',
+    'reluctance', 'scorn', 'self-pity', 'shock', 'sorrow', 'suffering', 'suspicion', 'sympathy',
+    'tension', 'thankfulness', 'thrill', 'triumph', 'uncertainty', 'unhappiness', 'warmth', 'wrath'
 ]
 
 # Initialize the emotion mappings with empty lists
 EMOTION_MAPPINGS = {emotion: [] for emotion in EMOTIONS}
 
+# Lowercased searchable text of each mapping, kept in step with EMOTION_MAPPINGS by
+# add_emotion_mapping so search_teachings doesn't re-lowercase every teaching per query
+_SEARCH_TEXT: Dict[str, List[str]] = {emotion: [] for emotion in EMOTIONS}
+
 def add_emotion_mapping(emotion: str, teaching: str, advice: str, verses: List[str],
                        example: str = None, related_emotions: List[str] = None) -> None:
     """
@@ -70,14 +66,19 @@ def add_emotion_mapping(emotion: str, teaching: str, advice: str, verses: List[s
         'example': example or ""
     }
     
+    # Fields are separated by NUL so a query can't match across two of them
+    search_text = '\0'.join([teaching.lower(), advice.lower(), *(verse.lower() for verse in verses)])
+    
     # Add to the primary emotion
     EMOTION_MAPPINGS[emotion].append(mapping)
+    _SEARCH_TEXT[emotion].append(search_text)
     
     # Add to related emotions if specified
     if related_emotions:
         for related in related_emotions:
             if related in EMOTION_MAPPINGS:
                 EMOTION_MAPPINGS[related].append(mapping)
+                _SEARCH_TEXT[related].append(search_text)
 
 def get_emotion_teachings(emotion: str) -> List[Dict[str, Any]]:
     """
@@ -105,12 +106,13 @@ def search_teachings(query: str) -> List[Dict[str, Any]]:
     results = []
     
     for emotion, teachings in EMOTION_MAPPINGS.items():
-        for teaching in teachings:
-            # Search in teaching text and advice
-            if (query in emotion.lower() or
-                query in teaching['teaching'].lower() or
-                query in teaching['advice'].lower() or
-                any(query in verse.lower() for verse in teaching['verses'])):
+        if not teachings:
+            continue
+        # A match on the emotion itself returns all of its teachings
+        emotion_match = query in emotion.lower()
+        for teaching, search_text in zip(teachings, _SEARCH_TEXT[emotion]):
+            # Search in teaching text, advice and verses
+            if emotion_match or query in search_text:
                 results.append({
                     'emotion': emotion,
                     **teaching
@@ -5,7 +5,8 @@ Uses Google's Gemini API instead of sentence-transformers to avoid heavy ML depe
 
 import os
 import logging
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 import google.generativeai as genai
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,9 @@ class GeminiEmbeddingService:
         
         genai.configure(api_key=api_key)
         self.model_name = "models/gemini-embedding-001"  # Correct model name for Gemini embeddings
+        # A repeated query (a retry, or the same question on another endpoint) reuses its
+        # embedding instead of making another API call
+        self._cached_query_embedding = lru_cache(maxsize=1024)(self._embed_query)
         logger.info(f"Initialized Gemini embedding service with model: {self.model_name}")
     
     def embed_text(self, text: str) -> List[float]:
@@ -55,13 +59,17 @@ class GeminiEmbeddingService:
         Returns:
             List of floats representing the embedding vector
         """
+        return list(self._cached_query_embedding(query))
+    
+    def _embed_query(self, query: str) -> Tuple[float, ...]:
+        """Call the API for a query embedding; stored as a tuple so cached vectors stay immutable."""
         try:
             result = genai.embed_content(
                 model=self.model_name,
                 content=query,
                 task_type="retrieval_query"
             )
-            return result['embedding']
+            return tuple(result['embedding'])
         except Exception as e:
             logger.error(f"Error generating query embedding: {e}")
             raise
@@ -4,19 +4,24 @@ Bhagavad Gita Character Database
 This module contains a comprehensive list of characters from the Bhagavad Gita
 along with their alternative names and aliases to help with character recognition.
 """
-from typing import Dict, List, TypedDict
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 
-class CharacterInfo(TypedDict):
+@dataclass(frozen=True, slots=True)
+class CharacterInfo:
     """Structure to hold character information."""
     primary_name: str
-    aliases: List[str]
+    aliases: Tuple[str, ...]
     description: str
     role: str
 
 
-# Main dictionary of characters with their information
-CHARACTERS: Dict[str, CharacterInfo] = {
+# Main dictionary of characters with their information, as written; CHARACTERS below is built from it
+_RAW_CHARACTERS = {
     # Divine Personalities
     "krishna": {
         "primary_name": "Krishna",
@@ -202,52 +207,64 @@ CHARACTERS: Dict[str, CharacterInfo] = {
     }
 }
 
+# Characters as compact, immutable records behind a read-only view
+CHARACTERS: Mapping[str, CharacterInfo] = MappingProxyType({
+    key: CharacterInfo(**{**info, "aliases": tuple(info["aliases"])})
+    for key, info in _RAW_CHARACTERS.items()
+})
+
+@lru_cache(maxsize=512)
+def _fold(name: str) -> str:
+    """Normalize a name for lookup: case-folded, with diacritics dropped ("Kṛṣṇa" -> "krsna")."""
+    decomposed = unicodedata.normalize('NFKD', name)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+# Lookup indexes, keyed by _fold(name) and built once at import. Keys and primary names take precedence over
+# aliases, and the first character listed wins when a name is shared (e.g. "Bharata").
+_NAME_INDEX: Dict[str, CharacterInfo] = {}
+_ALIAS_INDEX: Dict[str, CharacterInfo] = {}
+_ALIASES_BY_PRIMARY: Dict[str, Tuple[str, ...]] = {}
+_names: List[str] = []
+for _key, _info in CHARACTERS.items():
+    _NAME_INDEX.setdefault(_fold(_key), _info)
+    _NAME_INDEX.setdefault(_fold(_info.primary_name), _info)
+    for _alias in _info.aliases:
+        _ALIAS_INDEX.setdefault(_fold(_alias), _info)
+    _ALIASES_BY_PRIMARY.setdefault(_fold(_info.primary_name), _info.aliases)
+    _names.append(_info.primary_name)
+    _names.extend(_info.aliases)
+_NAME_INDEX = {**_ALIAS_INDEX, **_NAME_INDEX}
+_CHARACTER_NAMES = tuple(_names)
+del _ALIAS_INDEX, _names, _key, _info, _alias
+
 def get_character_info(name: str) -> CharacterInfo:
     """
     Get information about a character by any of their names or aliases.
     
     Args:
-        name: The name or alias of the character (case-insensitive)
+        name: The name or alias of the character (case- and diacritic-insensitive)
         
     Returns:
         CharacterInfo if found, None otherwise
     """
-    name_lower = name.lower()
-    
-    # Check primary names first
-    for char_name, char_info in CHARACTERS.items():
-        if char_name.lower() == name_lower or char_info["primary_name"].lower() == name_lower:
-            return char_info
-    
-    # Check aliases
-    for char_info in CHARACTERS.values():
-        if any(alias.lower() == name_lower for alias in char_info["aliases"]):
-            return char_info
-    
-    return None
+    return _NAME_INDEX.get(_fold(name))
 
 def get_character_names() -> List[str]:
     """Get a list of all primary character names and aliases."""
-    names = []
-    for char_info in CHARACTERS.values():
-        names.append(char_info["primary_name"])
-        names.extend(char_info["aliases"])
-    return names
+    return list(_CHARACTER_NAMES)
 
 def get_character_aliases(primary_name: str) -> List[str]:
     """
     Get all aliases for a character by their primary name.
     
     Args:
-        primary_name: The primary name of the character (case-insensitive)
+        primary_name: The primary name of the character (case- and diacritic-insensitive)
         
     Returns:
         List of aliases, or empty list if character not found
     """
-    for char_info in CHARACTERS.values():
-        if char_info["primary_name"].lower() == primary_name.lower():
-            return char_info["aliases"]
-    return []
+    return list(_ALIASES_BY_PRIMARY.get(_fold(primary_name), ()))
 
 if __name__ == "__main__":
     # Example usage
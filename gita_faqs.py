@@ -5,15 +5,18 @@ This module contains a comprehensive list of frequently asked questions about th
 along with their answers, organized by category for easy reference and integration
 into the Q&A system.
 """
-from typing import Dict, List, TypedDict
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
-class FAQItem(TypedDict):
+@dataclass(frozen=True, slots=True)
+class FAQItem:
     """Structure for storing FAQ items with metadata."""
     question: str
     answer: str
     category: str
-    keywords: List[str]
-    verse_references: List[str]
+    keywords: Tuple[str, ...]
+    verse_references: Tuple[str, ...]
 
 # Categories for organizing the FAQs
 CATEGORIES = [
@@ -29,8 +32,9 @@ CATEGORIES = [
     "Modern Application"
 ]
 
-# Comprehensive list of frequently asked questions about the Bhagavad Gita
-FAQ_LIST: List[FAQItem] = [
+# Comprehensive list of frequently asked questions about the Bhagavad Gita, as written;
+# FAQ_LIST below is built from it
+_RAW_FAQS = [
     {
         "question": "What is the Bhagavad Gita?",
         "answer": "The Bhagavad Gita, often referred to as the Gita, is a 700-verse Hindu scripture that is part of the epic Mahabharata. It is a conversation between Prince Arjuna and Lord Krishna, who serves as his charioteer. The Gita is set in a narrative framework of a dialogue between Pandava prince Arjuna and his guide and charioteer Krishna.",
@@ -145,6 +149,36 @@ FAQ_LIST: List[FAQItem] = [
     }
 ]
 
+# FAQs as compact, immutable records
+FAQ_LIST: Tuple[FAQItem, ...] = tuple(
+    FAQItem(**{**faq, "keywords": tuple(faq["keywords"]),
+               "verse_references": tuple(faq["verse_references"])})
+    for faq in _RAW_FAQS
+)
+
+# Lowercased search text of each FAQ, built once at import. Fields are separated by NUL
+# so a query can't match across two of them.
+_SEARCH_TEXT = tuple(
+    (faq, '\0'.join([faq.question.lower(), faq.answer.lower(),
+                      *(keyword.lower() for keyword in faq.keywords)]))
+    for faq in FAQ_LIST
+)
+
+# FAQs bucketed by lowercased category, in list order
+_grouped = defaultdict(list)
+for _faq in FAQ_LIST:
+    _grouped[_faq.category.lower()].append(_faq)
+_BY_CATEGORY: Dict[str, Tuple[FAQItem, ...]] = {
+    category: tuple(faqs) for category, faqs in _grouped.items()
+}
+del _faq, _grouped
+
+# FAQs by lowercased question; the first FAQ wins if a question is listed twice
+_BY_QUESTION: Dict[str, FAQItem] = {}
+for _faq in FAQ_LIST:
+    _BY_QUESTION.setdefault(_faq.question.lower(), _faq)
+del _faq
+
 def get_faqs_by_category(category: str = None) -> List[FAQItem]:
     """
     Get FAQs filtered by category.
@@ -156,8 +190,8 @@ def get_faqs_by_category(category: str = None) -> List[FAQItem]:
         List of FAQ items matching the category
     """
     if category:
-        return [faq for faq in FAQ_LIST if faq["category"].lower() == category.lower()]
-    return FAQ_LIST
+        return list(_BY_CATEGORY.get(category.lower(), ()))
+    return list(FAQ_LIST)
 
 def search_faqs(query: str) -> List[FAQItem]:
     """
@@ -170,16 +204,8 @@ def search_faqs(query: str) -> List[FAQItem]:
         List of matching FAQ items
     """
     query = query.lower()
-    results = []
-    
-    for faq in FAQ_LIST:
-        # Check if query is in question, answer, or keywords
-        if (query in faq["question"].lower() or
-            query in faq["answer"].lower() or
-            any(query in keyword.lower() for keyword in faq["keywords"])):
-            results.append(faq)
-    
-    return results
+    # Check if query is in question, answer, or keywords
+    return [faq for faq, search_text in _SEARCH_TEXT if query in search_text]
 
 def get_faq_by_question(question: str) -> Optional[FAQItem]:
     """
@@ -191,10 +217,7 @@ def get_faq_by_question(question: str) -> Optional[FAQItem]:
     Returns:
         The FAQ item if found, None otherwise
     """
-    for faq in FAQ_LIST:
-        if faq["question"].lower() == question.lower():
-            return faq
-    return None
+    return _BY_QUESTION.get(question.lower())
 
 if __name__ == "__main__":
     # Example usage
@@ -205,11 +228,11 @@ if __name__ == "__main__":
     karma_faqs = get_faqs_by_category("Karma Yoga")
     print(f"\nFound {len(karma_faqs)} FAQs about Karma Yoga:")
     for faq in karma_faqs:
-        print(f"- {faq['question']}")
+        print(f"- {faq.question}")
     
     # Example: Search for FAQs about meditation
     search_term = "meditation"
     search_results = search_faqs(search_term)
     print(f"\nSearch results for '{search_term}': {len(search_results)} found")
     for result in search_results:
-        print(f"- {result['question']} (Category: {result['category']})")
+        print(f"- {result.question} (Category: {result.category})")
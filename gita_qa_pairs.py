@@ -4,6 +4,7 @@ Bhagavad Gita Q&A Pairs
 This module contains a comprehensive list of questions and answers about the Bhagavad Gita,
 including both general knowledge and specific verse-based questions.
 """
+from difflib import SequenceMatcher
 from typing import Dict, List, Tuple
 
 # Categories for organizing questions
@@ -146,6 +147,20 @@ QA_PAIRS: List[Dict[str, any]] = [
     }
 ]
 
+# Q&A pairs bucketed by category, in list order; built once at import
+_QA_BY_CATEGORY: Dict[str, List[Dict[str, any]]] = {}
+for _qa in QA_PAIRS:
+    _QA_BY_CATEGORY.setdefault(_qa["category"], []).append(_qa)
+del _qa
+
+# What search_qa compares each pair against, lowercased and split once at import:
+# (qa, keywords, question, question terms, answer prefix)
+_QA_SEARCH_FIELDS = tuple(
+    (qa, tuple(qa.get('keywords', ())), qa['question'].lower(),
+     frozenset(qa['question'].lower().split()), qa['answer'][:100].lower())
+    for qa in QA_PAIRS
+)
+
 def get_qa_pairs() -> List[Dict[str, any]]:
     """Return the complete list of Q&A pairs with all details."""
     return QA_PAIRS
@@ -159,7 +174,7 @@ def get_qa_by_category(category: str) -> List[Dict[str, any]]:
     Returns:
         List of Q&A dictionaries in the specified category
     """
-    return [qa for qa in QA_PAIRS if qa["category"] == category]
+    return list(_QA_BY_CATEGORY.get(category, ()))
 
 def get_random_qa_pairs(count: int = 5) -> List[Dict[str, any]]:
     """Return a random selection of Q&A pairs.
@@ -183,32 +198,31 @@ def search_qa(query: str, threshold: float = 0.3) -> List[Dict[str, any]]:
     Returns:
         List of relevant Q&A dictionaries, sorted by relevance
     """
-    from difflib import SequenceMatcher
-    
     query = query.lower().strip()
     query_terms = set(query.split())
     results = []
     
-    for qa in QA_PAIRS:
+    for qa, keywords, question, question_terms, answer_prefix in _QA_SEARCH_FIELDS:
         # Check keywords first
-        if 'keywords' in qa and any(keyword in query for keyword in qa['keywords']):
+        if any(keyword in query for keyword in keywords):
             results.append((1.0, qa))  # High confidence for keyword match
             continue
-            
-        # Check question similarity
-        question = qa['question'].lower()
-        question_terms = set(question.split())
         
         # Calculate Jaccard similarity
-        intersection = len(query_terms.intersection(question_terms))
-        union = len(query_terms.union(question_terms))
+        intersection = len(query_terms & question_terms)
+        union = len(query_terms | question_terms)
         jaccard_sim = intersection / union if union > 0 else 0
         
-        # Calculate sequence similarity
-        seq_sim = max(
-            SequenceMatcher(None, query, question).ratio(),
-            SequenceMatcher(None, query, qa['answer'][:100].lower()).ratio()
-        )
+        # Calculate sequence similarity, skipping the full ratio() when even the
+        # cheap upper bounds can't lift the combined score to the threshold
+        seq_sim = 0.0
+        for text in (question, answer_prefix):
+            matcher = SequenceMatcher(None, query, text)
+            if (jaccard_sim * 0.6) + (matcher.real_quick_ratio() * 0.4) < threshold:
+                continue
+            if (jaccard_sim * 0.6) + (matcher.quick_ratio() * 0.4) < threshold:
+                continue
+            seq_sim = max(seq_sim, matcher.ratio())
         
         # Combined score (weighted average)
         score = (jaccard_sim * 0.6) + (seq_sim * 0.4)
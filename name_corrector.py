@@ -10,12 +10,25 @@ in user queries to their canonical forms using a combination of:
 from typing import Dict, Optional, List, Tuple
 import re
 from collections import defaultdict
+from functools import lru_cache
 from difflib import get_close_matches
 import jellyfish
 
 # Import the character database
 from gita_characters import CHARACTERS, get_character_info
 
+# Word tokenizer for correct_text
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+def _replace_words(text: str, replacements: Dict[str, str]) -> str:
+    """Replace whole-word occurrences of each key in replacements with its value."""
+    if not replacements:
+        return text
+    pattern = r'\b(?:' + '|'.join(map(re.escape, sorted(replacements, key=len, reverse=True))) + r')\b'
+    return re.sub(pattern, lambda m: replacements[m.group(0)], text)
+
+
 # Philosophical concepts that should never be corrected to character names
 PHILOSOPHICAL_CONCEPTS = {
     'karma', 'dharma', 'yoga', 'moksha', 'samsara', 'atman', 'brahman', 
@@ -36,6 +49,10 @@ class NameCorrector:
         self.threshold = threshold
         self.name_map = self._build_name_map()
         self.phonetic_map = self._build_phonetic_map()
+        # Every known spelling (aliases and primary names) for the edit-distance pass
+        self._all_names = tuple(set(self.name_map.keys()) | set(self.name_map.values()))
+        # The same words recur across questions, so each lookup is only worked out once
+        self._cached_correct_name = lru_cache(maxsize=4096)(self._correct_name)
         
     def _build_name_map(self) -> Dict[str, str]:
         """Build a mapping of all possible name variations to their canonical forms."""
@@ -79,13 +96,13 @@ class NameCorrector:
         
         # Add all primary names and their aliases to the map
         for char_name, char_info in CHARACTERS.items():
-            primary = char_info["primary_name"].lower()
+            primary = char_info.primary_name.lower()
             
             # Map primary name to itself
             name_map[primary] = primary
             
             # Map all aliases to primary name
-            for alias in char_info["aliases"]:
+            for alias in char_info.aliases:
                 alias_lower = alias.lower()
                 name_map[alias_lower] = primary
                 
@@ -108,8 +125,8 @@ class NameCorrector:
         
         # Add primary names and aliases to phonetic map
         for char_name, char_info in CHARACTERS.items():
-            primary = char_info["primary_name"].lower()
-            names_to_add = [primary] + [a.lower() for a in char_info["aliases"]]
+            primary = char_info.primary_name.lower()
+            names_to_add = [primary] + [a.lower() for a in char_info.aliases]
             
             for name in names_to_add:
                 # Generate phonetic hashes using different algorithms
@@ -163,8 +180,10 @@ class NameCorrector:
         if not name or not name.strip():
             return None, 0.0
             
-        name = name.lower().strip()
-        
+        return self._cached_correct_name(name.lower().strip())
+    
+    def _correct_name(self, name: str) -> Tuple[Optional[str], float]:
+        """Uncached correct_name for an already lowercased and stripped name."""
         # Check for direct match first (fast path)
         if name in self.name_map:
             return self.name_map[name], 1.0
@@ -182,9 +201,7 @@ class NameCorrector:
         best_score = 0.0
         
         # Consider all known names (primary + aliases)
-        all_names = set(self.name_map.keys()) | set(self.name_map.values())
-        
-        for known_name in all_names:
+        for known_name in self._all_names:
             score = self._get_edit_distance_score(name, known_name)
             if score > best_score and score >= self.threshold:
                 best_match = known_name
@@ -222,7 +239,7 @@ class NameCorrector:
             return text, {}
             
         # Tokenize the text (simple word-based tokenizer)
-        words = re.findall(r'\b\w+\b', text)
+        words = _WORD_RE.findall(text)
         corrections = {}
         
         # Check each word and its context
@@ -251,11 +268,14 @@ class NameCorrector:
                 
                 corrections[original] = corrected
         
-        # Apply all corrections to the original text
+        # Apply all corrections to the original text in a single pass. A correction can
+        # itself contain a later-corrected word (e.g. krishn -> krsna -> krishna), so each
+        # one is first resolved against the corrections after it
         if corrections:
-            for orig, corr in corrections.items():
-                # Use regex to preserve word boundaries
-                text = re.sub(r'\b' + re.escape(orig) + r'\b', corr, text)
+            resolved = {}
+            for orig, corr in reversed(corrections.items()):
+                resolved[orig] = _replace_words(corr, resolved)
+            text = _replace_words(text, resolved)
         
         return text, corrections
 
@@ -277,6 +297,13 @@ def correct_character_name(name: str) -> Tuple[Optional[str], float]:
     return name_corrector.correct_name(name)
 
 
+@lru_cache(maxsize=4096)
+def _correct_text_cached(text: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Memoized correct_text; corrections are frozen so cached results can't be mutated."""
+    corrected, corrections = name_corrector.correct_text(text)
+    return corrected, tuple(corrections.items())
+
+
 def correct_text_names(text: str) -> Tuple[str, Dict[str, str]]:
     """
     Correct all character names in a piece of text.
@@ -287,7 +314,8 @@ def correct_text_names(text: str) -> Tuple[str, Dict[str, str]]:
     Returns:
         A tuple of (corrected_text, corrections_made)
     """
-    return name_corrector.correct_text(text)
+    corrected, corrections = _correct_text_cached(text)
+    return corrected, dict(corrections)
 
 
 if __name__ == "__main__":
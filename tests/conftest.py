@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+# The modules under test live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# QASystem.load_and_process_pdf skips this many pages of front matter
+FRONT_MATTER_PAGES = 10
+
+
+@pytest.fixture
+def pdf_cache_dir(tmp_path, monkeypatch):
+    """Point the parsed-PDF cache at a fresh temporary directory."""
+    import app
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(app, "PDF_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def make_pdf(tmp_path, pdf_cache_dir):
+    """Write a PDF whose pages after the front matter hold the given texts; returns its path.
+
+    Parsing it caches into pdf_cache_dir, never the working tree.
+    """
+    pymupdf = pytest.importorskip("pymupdf")
+
+    def make(pages, name="book.pdf"):
+        pdf = pymupdf.open()
+        for _ in range(FRONT_MATTER_PAGES):
+            pdf.new_page()
+        for text in pages:
+            pdf.new_page().insert_textbox(pymupdf.Rect(36, 36, 560, 800), text, fontsize=10)
+        path = str(tmp_path / name)
+        pdf.save(path)
+        pdf.close()
+        return path
+
+    return make
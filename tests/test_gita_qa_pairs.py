@@ -0,0 +1,56 @@
+from difflib import SequenceMatcher
+
+import pytest
+
+from gita_qa_pairs import QA_PAIRS, search_qa
+
+
+def questions(results):
+    return [qa["question"] for qa in results]
+
+
+def test_keyword_hit_ranks_first():
+    assert questions(search_qa("tell me about karma yoga"))[0] == "What is Karma Yoga according to the Gita?"
+    assert questions(search_qa("the gita was written by whom"))[0] == "Who wrote the Bhagavad Gita?"
+
+
+def test_exact_question_ranks_first():
+    for qa in QA_PAIRS:
+        if not any(keyword in qa["question"].lower() for keyword in qa.get("keywords", ())):
+            assert questions(search_qa(qa["question"]))[0] == qa["question"]
+
+
+def test_unrelated_query_finds_nothing():
+    assert search_qa("hello there") == []
+    assert search_qa("") == []
+
+
+def unpruned_score(query, qa):
+    """The combined score search_qa prunes with quick_ratio, computed in full."""
+    question = qa["question"].lower()
+    query_terms, question_terms = set(query.split()), set(question.split())
+    union = len(query_terms | question_terms)
+    jaccard_sim = len(query_terms & question_terms) / union if union else 0
+    seq_sim = max(SequenceMatcher(None, query, question).ratio(),
+                  SequenceMatcher(None, query, qa["answer"][:100].lower()).ratio())
+    return jaccard_sim * 0.6 + seq_sim * 0.4
+
+
+QUERIES = [qa["question"] for qa in QA_PAIRS] + [qa["answer"][:100] for qa in QA_PAIRS] + [
+    "what does krishna say about the restless mind",
+    "why did arjuna refuse to fight",
+    "is the soul eternal",
+    "how should i meditate every day",
+    "gita",
+]
+
+
+@pytest.mark.parametrize("threshold", [0.1, 0.3, 0.5])
+def test_pruning_keeps_every_pair_that_clears_the_threshold(threshold):
+    for query in QUERIES:
+        found = questions(search_qa(query, threshold))
+        lowered = query.lower().strip()
+        for qa in QA_PAIRS:
+            keyword_hit = any(keyword in lowered for keyword in qa.get("keywords", ()))
+            if not keyword_hit:
+                assert (qa["question"] in found) == (unpruned_score(lowered, qa) >= threshold), (query, qa["question"])
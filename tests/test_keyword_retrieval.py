@@ -0,0 +1,52 @@
+import pytest
+
+from app import QASystem
+
+# Padding so every page clears the 100-character minimum for a search document;
+# none of these words are used in queries
+FILLER = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+          "incididunt labore dolore magna aliqua")
+
+
+@pytest.fixture
+def qa(make_pdf):
+    pages = [
+        "krishna arjuna",          # page 11
+        "krishna arjuna dharma",   # page 12
+        "krishna arjuna dharma",   # page 13
+        "arjuna dharma",           # page 14
+        "",                        # page 15
+        "",                        # page 16
+    ]
+    qa = QASystem(make_pdf([f"{text} {FILLER}" for text in pages]))
+    qa.load_and_process_pdf()
+    assert len(qa.documents) == len(pages)
+    return qa
+
+
+def pages(docs):
+    return [doc.metadata["page"] for doc in docs]
+
+
+def test_best_matches_come_first(qa):
+    assert pages(qa.get_relevant_documents("krishna arjuna dharma", k=2)) == [12, 13]
+
+
+def test_equal_scores_keep_page_order(qa):
+    # Pages 11 and 14 both match two of the three terms
+    assert pages(qa.get_relevant_documents("krishna arjuna dharma", k=4)) == [12, 13, 11, 14]
+
+
+def test_k_caps_the_result(qa):
+    assert len(qa.get_relevant_documents("krishna arjuna dharma", k=1)) == 1
+    assert len(qa.get_relevant_documents("krishna arjuna dharma", k=10)) == 4
+
+
+def test_pages_need_two_matching_terms(qa):
+    # Only "dharma" is in page 14 for this query, so it is not a match
+    assert 14 not in pages(qa.get_relevant_documents("krishna dharma yoga", k=5))
+
+
+def test_weak_matches_fall_back_to_middle_pages(qa):
+    # No page shares two terms with the query, so the middle of the book is served
+    assert pages(qa.get_relevant_documents("krishna battle", k=2)) == [14, 15]
@@ -0,0 +1,52 @@
+import re
+
+import pytest
+
+from name_corrector import _replace_words, correct_text_names, name_corrector
+
+
+@pytest.mark.parametrize("text, corrected", [
+    ("Arjun asked Krishn about karma", "Arjuna asked Krsna about karma"),
+    ("Krsna-Arjun dialogue", "Krishna-Arjuna dialogue"),
+    ("Yudhistir, Draupadi", "Yudhishthira, Draupadi"),
+    ("bheema bhima karan", "bhima bhima karna"),
+    # Capitalization of the original word is kept
+    ("ARJUN and arjunas", "ARJUNA and arjuna"),
+    # Philosophical terms are never turned into names
+    ("What is dharma and yoga?", "What is dharma and yoga?"),
+])
+def test_correct_text(text, corrected):
+    assert name_corrector.correct_text(text)[0] == corrected
+
+
+def test_chained_corrections_resolve_to_the_last_spelling():
+    # krishn corrects to krsna, which is itself corrected to krishna later in the text
+    corrected, corrections = name_corrector.correct_text("krishn and krsna")
+    assert corrections == {"krishn": "krsna", "krsna": "krishna"}
+    assert corrected == "krishna and krishna"
+
+
+@pytest.mark.parametrize("text", [
+    "krishn and krsna",
+    "Krsna told Arjun; arjun listened to krishn",
+    "bheema, bhima and Bheeshma met karan and Duryodhan",
+    "dron's student arjun asked Krsna-krishn",
+])
+def test_single_pass_matches_one_substitution_per_correction(text):
+    corrected, corrections = name_corrector.correct_text(text)
+    expected = text
+    for orig, corr in corrections.items():
+        expected = re.sub(r'\b' + re.escape(orig) + r'\b', corr, expected)
+    assert corrected == expected
+
+
+def test_replace_words_matches_whole_words_longest_first():
+    replacements = {"arjun": "arjuna", "arjuna": "partha"}
+    assert _replace_words("arjun arjuna arjunas", replacements) == "arjuna partha arjunas"
+    assert _replace_words("unchanged", {}) == "unchanged"
+
+
+def test_memoized_corrections_are_not_shared():
+    _, corrections = correct_text_names("Arjun spoke")
+    corrections["Arjun"] = "tampered"
+    assert correct_text_names("Arjun spoke") == ("Arjuna spoke", {"Arjun": "Arjuna"})
@@ -0,0 +1,23 @@
+import pytest
+
+from app import QASystem
+
+
+@pytest.mark.parametrize("raw, cleaned", [
+    # Page numbers on their own line go, numbers inside text stay
+    ("TEXT 47\n\n112\nkarmaṇy evādhikāras te\n", "TEXT 47 karmaṇy evādhikāras te"),
+    ("12\nFirst line\n  34  \nSecond line\n56", "First line Second line"),
+    ("verse 2.47 is here\n", "verse 2.47 is here"),
+    # Any decimal digits count as a page number, superscripts do not
+    ("Chapter ١٢\n١٢\nend", "Chapter ١٢ end"),
+    ("x²\n²\ny", "x² ² y"),
+    # Running header with its page number
+    ("Bhagavad-gītā As It Is 112\nPurport text", "Purport text"),
+    # A page number on the next line is dropped first, so the header words remain
+    ("Bhagavad-gītā As It Is\n7\nText", "Bhagavad-gītā As It Is Text"),
+    # All whitespace collapses to single spaces
+    ("a\r\n\r\n\tb", "a b"),
+    ("", ""),
+])
+def test_clean_text(raw, cleaned):
+    assert QASystem.clean_text(raw) == cleaned
@@ -0,0 +1,110 @@
+import gzip
+import os
+import pickle
+import shutil
+
+import pytest
+
+import app
+from app import QASystem, _pdf_cache_path
+
+PAGES = [
+    "The soul is never born and never dies at any time. It has not come into being, "
+    "does not come into being, and will not come into being.",
+    "You have a right to perform your prescribed duty, but you are not entitled to the "
+    "fruits of action. Never consider yourself the cause of the results.",
+]
+
+
+def load(pdf_path):
+    qa = QASystem(pdf_path)
+    qa.load_and_process_pdf()
+    return qa
+
+
+def pages_for(qa, query):
+    return [doc.metadata["page"] for doc in qa.get_relevant_documents(query, k=1)]
+
+
+def test_identical_bytes_share_a_cache_file(make_pdf, tmp_path):
+    pdf_path = make_pdf(PAGES)
+    copy_path = shutil.copy(pdf_path, tmp_path / "copy.pdf")
+    assert _pdf_cache_path(pdf_path) == _pdf_cache_path(copy_path)
+
+
+def test_edited_pdf_misses_the_cache(make_pdf):
+    original = make_pdf(PAGES)
+    edited = make_pdf(PAGES + ["An added page of commentary that is long enough to be indexed as a document."],
+                      name="edited.pdf")
+    assert _pdf_cache_path(original) != _pdf_cache_path(edited)
+
+
+def test_version_bump_misses_the_cache(make_pdf, monkeypatch):
+    pdf_path = make_pdf(PAGES)
+    before = _pdf_cache_path(pdf_path)
+    monkeypatch.setattr(app, "_PDF_CACHE_VERSION", app._PDF_CACHE_VERSION + 1)
+    assert _pdf_cache_path(pdf_path) != before
+
+
+@pytest.mark.parametrize("flag", ["PYMUPDF_AVAILABLE", "RE2_AVAILABLE"])
+def test_changing_parser_misses_the_cache(make_pdf, monkeypatch, flag):
+    pdf_path = make_pdf(PAGES)
+    before = _pdf_cache_path(pdf_path)
+    monkeypatch.setattr(app, flag, not getattr(app, flag))
+    assert _pdf_cache_path(pdf_path) != before
+
+
+def test_cache_dir_does_not_depend_on_the_working_directory():
+    assert app.PDF_CACHE_DIR == os.path.join(os.path.dirname(os.path.abspath(app.__file__)), "data")
+
+
+def test_second_load_skips_parsing(make_pdf, monkeypatch):
+    pdf_path = make_pdf(PAGES)
+    first = load(pdf_path)
+    assert len(first.documents) == 2
+    assert os.path.exists(_pdf_cache_path(pdf_path))
+
+    def parse_again(*args, **kwargs):
+        raise AssertionError("parsed the PDF despite a valid cache")
+
+    monkeypatch.setattr(app, "_prepare_pages", parse_again)
+    second = load(pdf_path)
+    assert [d.page_content for d in second.documents] == [d.page_content for d in first.documents]
+    assert [d.metadata for d in second.documents] == [d.metadata for d in first.documents]
+    assert second.verse_index == first.verse_index
+    assert dict(second.postings) == dict(first.postings)
+    assert pages_for(second, "prescribed duty fruits") == [12]
+
+
+def test_failed_write_leaves_no_cache_file(make_pdf, pdf_cache_dir, monkeypatch):
+    def dump_then_fail(data, f, protocol=None):
+        f.write(b"partial")
+        raise pickle.PicklingError("cannot pickle")
+
+    monkeypatch.setattr(app.pickle, "dump", dump_then_fail)
+    pdf_path = make_pdf(PAGES)
+    load(pdf_path)
+    assert os.listdir(pdf_cache_dir) == []
+
+
+def test_cached_pages_report_the_path_they_were_loaded_from(make_pdf, tmp_path):
+    pdf_path = make_pdf(PAGES)
+    load(pdf_path)
+    moved_path = str(shutil.copy(pdf_path, tmp_path / "moved.pdf"))
+    qa = QASystem(moved_path)
+    assert qa._load_cache(_pdf_cache_path(moved_path))
+    assert {doc.metadata["source"] for doc in qa.documents} == {moved_path}
+    assert all(verse["source"] == moved_path for verse in qa.verse_index.values())
+
+
+@pytest.mark.parametrize("contents", [b"", b"not gzip", gzip.compress(b"not a pickle")])
+def test_unreadable_cache_is_reparsed_and_replaced(make_pdf, contents):
+    pdf_path = make_pdf(PAGES)
+    cache_path = _pdf_cache_path(pdf_path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, "wb") as f:
+        f.write(contents)
+
+    qa = load(pdf_path)
+    assert len(qa.documents) == 2
+    assert QASystem(pdf_path)._load_cache(cache_path)
@@ -0,0 +1,22 @@
+import pytest
+
+from app import QASystem
+
+PAGE = "Page {n}: the wise lament neither for the living nor for the dead, for the soul is eternal, unborn, undying and ever-existing."
+
+
+def test_page_that_fails_to_extract_is_skipped(make_pdf, monkeypatch, capsys):
+    pymupdf = pytest.importorskip("pymupdf")
+    get_text = pymupdf.Page.get_text
+
+    def flaky_get_text(page, *args, **kwargs):
+        if page.number == 11:
+            raise ValueError("malformed content stream")
+        return get_text(page, *args, **kwargs)
+
+    monkeypatch.setattr(pymupdf.Page, "get_text", flaky_get_text)
+    qa = QASystem(make_pdf([PAGE.format(n=n) for n in range(3)]))
+    qa.load_and_process_pdf()
+
+    assert [doc.metadata["page"] for doc in qa.documents] == [11, 13]
+    assert "Error processing page 12: malformed content stream" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+import os
+import re
+
+import pytest
+
+import app
+from app import _VERSE_RE, _find_verse_refs, _split_lines
+
+
+def first_ref(line):
+    refs = _find_verse_refs([line])
+    return refs[0].groups() if refs else None
+
+
+@pytest.mark.parametrize("line, ref", [
+    ("TEXT 2.47", ("2", "47")),
+    ("Bg 18.66 purport", ("18", "66")),
+    ("Bg2.46", ("2", "46")),
+    ("see 1.2.3 and 4.5", ("2", "3")),
+    ("2.47, then", None),
+    ("chapter two", None),
+])
+def test_verse_reference_on_a_line(line, ref):
+    assert first_ref(line) == ref
+
+
+def test_reference_is_reported_on_its_own_line():
+    refs = _find_verse_refs(["Purport", "TEXT 3.5", "words", "Bg 3.6 and 3.7"])
+    assert {line: m.groups() for line, m in refs.items()} == {1: ("3", "5"), 3: ("3", "6")}
+
+
+# Only ASCII digits and ASCII whitespace delimit a reference, so RE2 and re agree. The
+# original pattern used \d and \s, which re reads as Unicode; these cases pin the change.
+@pytest.mark.parametrize("line", [
+    "2.47\u00a0karmaṇy",     # no-break space after the reference
+    "2.47\u2003text",        # em space
+    "\u0662.\u0664\u0667 text",   # Arabic-Indic digits
+    "\u0968.\u096a\u096d text",   # Devanagari digits
+])
+def test_non_ascii_digits_and_spaces_do_not_delimit_a_reference(line):
+    assert first_ref(line) is None
+
+
+@pytest.mark.parametrize("line", ["TEXT 2.47", "Bg2.46\n", "1.2.3 4.5", "2.47 x", "٢.٤٧ x", "3.4 "])
+def test_re2_and_re_agree(line):
+    re2 = pytest.importorskip("re2")
+    matches = [(m.span(), m.groups()) for m in re.finditer(_VERSE_RE.pattern, line)]
+    assert [(m.span(), m.groups()) for m in re2.finditer(_VERSE_RE.pattern, line)] == matches
+
+
+BUNDLED_PDF = os.path.join(os.path.dirname(os.path.abspath(app.__file__)), "11-Bhagavad-gita_As_It_Is.pdf")
+
+
+@pytest.mark.skipif(not os.path.exists(BUNDLED_PDF), reason="bundled PDF not present")
+def test_bundled_pdf_does_not_rely_on_unicode_matching():
+    # If the PDF is ever replaced by one whose references are only found with Unicode
+    # \d/\s, verses would silently go missing from the index; fail here instead
+    unicode_re = re.compile(r'(?:Bg\s*)?(\d+)\.(\d+)(?:\s|$)')
+    for page_num, text in enumerate(app._extract_page_texts(BUNDLED_PDF)):
+        lines = _split_lines(text or "")
+        refs = _find_verse_refs(lines)
+        for line_no, line in enumerate(lines):
+            match = unicode_re.search(line)
+            expected = match.groups() if match else None
+            found = refs[line_no].groups() if line_no in refs else None
+            assert found == expected, (page_num + 1, line)